@@ -2,21 +2,26 @@
 Zillow Real Estate Data Scraper
 -------------------------------
 This script scrapes property data from a Zillow clone website and submits it to a Google Form.
-It demonstrates web scraping techniques using both requests/BeautifulSoup and Selenium.
+It demonstrates web scraping techniques using requests/selectolax, submits form responses
+with direct HTTP POSTs, and exports the collected responses through the Google Drive API.
 """
+import asyncio
+import csv
+import itertools
+import json
+import html
 import logging
-import time
-from typing import List, Dict, Any, Optional, Tuple
+import os
+import re
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple, Union
+import httpx
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+import requests_cache
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 
 # Configure logging
@@ -34,8 +39,88 @@ logger = logging.getLogger(__name__)
 # Constants
 ZILLOW_CLONE_URL = "https://appbrewery.github.io/Zillow-Clone/"
 GOOGLE_FORM_URL = "https://forms.gle/z4JvQZx8jTBDzMpw8"
-RESPONSES_URL = "https://docs.google.com/forms/d/1tSK6EafVovJYyUxPo4tGAGosrzZtcElg7V6d5-Z0Z0g/edit?pli=1#responses"
-WAIT_TIME = 5  # Maximum wait time in seconds for Selenium operations
+REQUEST_TIMEOUT = 10  # Timeout in seconds for page fetches
+MAX_FETCH_WORKERS = 16  # Threads used to fetch multiple listing pages concurrently
+PARSE_CHUNKS_PER_WORKER = 4  # Spread pages so each parsing process gets about this many chunks
+CACHE_NAME = "zillow_cache"  # SQLite file used to cache fetched listing pages
+CACHE_EXPIRE_AFTER = 3600  # Seconds before a cached listing page is fetched again
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0 Safari/537.36"
+MAX_CONCURRENT_SUBMISSIONS = 10  # Cap on in-flight form submissions to avoid Google rate limits
+MAX_RETRIES = 3  # Attempts per form submission
+
+# Google Drive export of the form's linked responses spreadsheet
+GOOGLE_CREDENTIALS_FILE = "credentials.json"  # Service account key with access to the responses spreadsheet
+DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
+SPREADSHEET_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
+RESPONSES_SHEET_SUFFIX = " (Responses)"  # Google names linked sheets "<form title> (Responses)"
+RESPONSES_CSV_FILE = "form_responses.csv"
+
+# Patterns used to discover the Google Form's submission endpoint and fields
+FORM_ID_RE = re.compile(r"/forms/d/e/([\w-]+)/")
+FB_LOAD_DATA_RE = re.compile(r"FB_PUBLIC_LOAD_DATA_\s*=\s*(.*?);\s*</script>", re.DOTALL)
+ENTRY_NAME_RE = re.compile(r'name="(entry\.\d+)"')
+FORM_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.DOTALL)
+
+# Selectors for the listing cards and their fields
+CARD_SELECTOR = "li.ListItem-c11n-8-84-3-StyledListCardWrapper"
+LINK_SELECTOR = "a[href]"
+PRICE_SELECTOR = "span.PropertyCardWrapper__StyledPriceLine"
+ADDRESS_SELECTOR = "address"
+PRICE_RE = re.compile(r"[^+/]*")  # Price up to any "+ 1 bd" or "/mo" suffix
+
+
+@dataclass(slots=True, frozen=True)
+class Property:
+    """A single scraped property listing."""
+    
+    link: str
+    price: str
+    address: str
+
+
+def parse_html(html_content: str) -> List[Property]:
+    """
+    Parse properties from the HTML of a listing page.
+    
+    Defined at module level so it can be sent to worker processes.
+    
+    Args:
+        html_content: The HTML content to parse
+        
+    Returns:
+        List of parsed properties
+    """
+    tree = LexborHTMLParser(html_content)
+    property_cards = tree.css(CARD_SELECTOR)
+    
+    if not property_cards:
+        logger.warning("No property cards found on the page")
+        return []
+    
+    logger.info(f"Found {len(property_cards)} property cards")
+    
+    properties = []
+    for card in property_cards:
+        try:
+            # Extract link
+            link_element = card.css_first(LINK_SELECTOR)
+            link = (link_element.attributes.get("href") or "N/A") if link_element else "N/A"
+            
+            # Extract price
+            price_element = card.css_first(PRICE_SELECTOR)
+            price = PRICE_RE.match(price_element.text()).group(0).strip() if price_element else "N/A"
+            
+            # Extract address
+            address_element = card.css_first(ADDRESS_SELECTOR)
+            raw_address = address_element.text() if address_element else "N/A"
+            address = raw_address.strip().replace("|", "")
+            
+            properties.append(Property(link, price, address))
+        except Exception as e:
+            logger.error(f"Error parsing property card: {e}")
+            continue
+    
+    return properties
 
 
 class PropertyScraper:
@@ -50,24 +135,61 @@ class PropertyScraper:
         """
         self.url = url
         self.properties = []
+        
+        # Reuse pooled keep-alive connections instead of a new TCP+TLS handshake per request,
+        # and serve repeated fetches within CACHE_EXPIRE_AFTER from the on-disk cache
+        self.session = requests_cache.CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_FETCH_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logger.info(f"Initializing scraper for {url}")
     
-    def fetch_page(self) -> Optional[str]:
+    def fetch_page(self, url: Optional[str] = None) -> Optional[str]:
         """
-        Fetch the HTML content of the target page.
+        Fetch the HTML content of a page.
         
+        Args:
+            url: The URL to fetch; defaults to the scraper's target URL
+            
         Returns:
             The HTML content as string if successful, None otherwise
         """
+        url = url or self.url
         try:
-            logger.info(f"Fetching page content from {self.url}")
-            response = requests.get(self.url, timeout=10)
+            logger.info(f"Fetching page content from {url}")
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()  # Raise exception for 4XX/5XX responses
-            return response.content.decode("utf-8")
+            
+            # Decode with the charset from the headers; without one requests would assume ISO-8859-1
+            if "charset" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = "utf-8"
+            return response.text
         except requests.RequestException as e:
             logger.error(f"Failed to fetch page: {e}")
             return None
     
+    def fetch_pages(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Fetch several pages concurrently over the shared session.
+        
+        Args:
+            urls: The URLs to fetch
+            
+        Returns:
+            The HTML content of each page in the same order as the URLs, None for failed fetches
+        """
+        if not urls:
+            return []
+        
+        pages = [None] * len(urls)
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(self.fetch_page, url): i for i, url in enumerate(urls)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                pages[futures[future]] = future.result()
+                logger.info(f"Fetched {done}/{len(urls)} pages")
+        return pages
+    
     def parse_properties(self, html_content: str) -> bool:
         """
         Parse property data from HTML content.
@@ -80,53 +202,57 @@ class PropertyScraper:
         """
         try:
             logger.info("Parsing property data from HTML")
-            soup = BeautifulSoup(html_content, "html.parser")
-            property_cards = soup.find_all(name="li", class_="ListItem-c11n-8-84-3-StyledListCardWrapper")
-            
-            if not property_cards:
-                logger.warning("No property cards found on the page")
+            properties = parse_html(html_content)
+            if not properties:
                 return False
             
-            logger.info(f"Found {len(property_cards)} property cards")
+            self.properties.extend(properties)
+            logger.info(f"Successfully parsed {len(self.properties)} properties")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to parse properties: {e}")
+            return False
+    
+    def parse_pages(self, html_pages: List[str]) -> bool:
+        """
+        Parse several pages in a process pool so parsing isn't limited to one core by the GIL.
+        
+        Args:
+            html_pages: The HTML content of each page to parse
             
-            for card in property_cards:
-                try:
-                    # Extract link
-                    link_element = card.find(name="a", href=True)
-                    link = link_element['href'] if link_element else "N/A"
-                    
-                    # Extract price
-                    price_element = card.find(name="span", class_="PropertyCardWrapper__StyledPriceLine")
-                    raw_price = price_element.text if price_element else "N/A"
-                    price = raw_price.split("+", 1)[0].split("/", 1)[0].strip()
-                    
-                    # Extract address
-                    address_element = card.find(name="address")
-                    raw_address = address_element.text if address_element else "N/A"
-                    address = raw_address.strip().replace("|", "")
-                    
-                    # Add to properties list
-                    self.properties.append({
-                        "link": link,
-                        "price": price,
-                        "address": address
-                    })
-                except Exception as e:
-                    logger.error(f"Error parsing property card: {e}")
-                    continue
+        Returns:
+            True if any properties were parsed, False otherwise
+        """
+        try:
+            logger.info(f"Parsing property data from {len(html_pages)} pages")
+            
+            # Size the pool and chunks to the workload so every worker actually gets pages
+            workers = min(os.cpu_count() or 1, len(html_pages))
+            if workers > 1:
+                chunksize = max(1, len(html_pages) // (workers * PARSE_CHUNKS_PER_WORKER))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(parse_html, html_pages, chunksize=chunksize)
+                    properties = list(itertools.chain.from_iterable(results))
+            else:
+                properties = list(itertools.chain.from_iterable(map(parse_html, html_pages)))
+            
+            if not properties:
+                logger.warning("No properties found on any page")
+                return False
             
+            self.properties.extend(properties)
             logger.info(f"Successfully parsed {len(self.properties)} properties")
             return True
         except Exception as e:
             logger.error(f"Failed to parse properties: {e}")
             return False
     
-    def get_properties(self) -> List[Dict[str, str]]:
+    def get_properties(self) -> List[Property]:
         """
         Get the list of scraped properties.
         
         Returns:
-            List of dictionaries containing property data
+            List of scraped properties
         """
         return self.properties
     
@@ -145,188 +271,278 @@ class PropertyScraper:
                 logger.warning("No properties to save")
                 return False
                 
-            df = pd.DataFrame(self.properties)
-            df.to_csv(filename, index=False)
+            with open(filename, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(["link", "price", "address"])
+                writer.writerows((prop.link, prop.price, prop.address) for prop in self.properties)
             logger.info(f"Saved {len(self.properties)} properties to {filename}")
             return True
         except Exception as e:
             logger.error(f"Failed to save to CSV: {e}")
             return False
     
-    def scrape(self) -> Tuple[bool, int]:
+    def scrape(self, urls: Optional[Union[str, List[str]]] = None) -> Tuple[bool, int]:
         """
         Perform the complete scraping process.
         
+        Args:
+            urls: A URL or list of listing page URLs to scrape; defaults to the scraper's target URL
+        
         Returns:
             Tuple of (success_status, number_of_properties_scraped)
         """
-        html_content = self.fetch_page()
-        if not html_content:
+        if urls is None:
+            urls = [self.url]
+        elif isinstance(urls, str):
+            urls = [urls]
+        
+        if not urls:
+            logger.error("No URLs to scrape")
             return False, 0
-            
-        success = self.parse_properties(html_content)
+        
+        html_pages = self.fetch_pages(urls) if len(urls) > 1 else [self.fetch_page(urls[0])]
+        html_pages = [html_content for html_content in html_pages if html_content]
+        if not html_pages:
+            return False, 0
+        
+        if len(html_pages) > 1:
+            success = self.parse_pages(html_pages)
+        else:
+            success = self.parse_properties(html_pages[0])
         return success, len(self.properties)
+    
+    def close(self):
+        """Close the HTTP session."""
+        logger.info("Closing scraper session")
+        self.session.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """
+    Decide whether a failed form submission is worth retrying.
+    
+    Transport errors, timeouts, rate limiting (429) and server errors (5XX) may succeed on
+    a later attempt; other statuses, such as a 400 for an invalid payload or a sign-in
+    redirect, will not.
+    
+    Args:
+        error: The exception raised by the submission
+        
+    Returns:
+        True if the submission should be retried, False otherwise
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, httpx.TransportError)
 
 
 class GoogleFormSubmitter:
-    """A class to submit data to a Google Form using Selenium."""
+    """A class to submit data to a Google Form using concurrent HTTP POST requests."""
     
-    def __init__(self, form_url: str, headless: bool = False):
+    def __init__(self, form_url: str):
         """
         Initialize the form submitter with the form URL.
         
         Args:
             form_url: The URL of the Google Form
-            headless: Whether to run the browser in headless mode
         """
         self.form_url = form_url
-        self.driver = None
-        self.headless = headless
+        self.session = requests.Session()
+        self.action_url = None
+        self.entry_ids = []
+        self.form_title = None
         logger.info(f"Initializing form submitter for {form_url}")
     
-    def setup_driver(self) -> bool:
+    def load_form(self) -> bool:
         """
-        Set up the Selenium WebDriver.
+        Fetch the form once to discover its submission URL and field entry IDs.
         
         Returns:
-            True if setup was successful, False otherwise
+            True if the form fields were discovered, False otherwise
         """
         try:
-            logger.info("Setting up Chrome WebDriver")
-            options = Options()
-            options.add_experimental_option("detach", True)
+            logger.info(f"Loading form fields from {self.form_url}")
+            response = self.session.get(self.form_url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            html_content = response.text
+            
+            # The formResponse URL is built from the form ID in the resolved viewform URL
+            form_id_match = FORM_ID_RE.search(response.url) or FORM_ID_RE.search(html_content)
+            if not form_id_match:
+                logger.error("Could not determine the form ID")
+                return False
             
-            if self.headless:
-                options.add_argument("--headless")
-                options.add_argument("--window-size=1920,1080")
+            entry_ids = self._extract_entry_ids(html_content)
+            if len(entry_ids) < 3:
+                logger.error(f"Expected at least 3 form fields, found {len(entry_ids)}")
+                return False
             
-            # Add additional options for stability
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
+            title_match = FORM_TITLE_RE.search(html_content)
+            self.form_title = html.unescape(title_match.group(1)).strip() if title_match else None
             
-            self.driver = webdriver.Chrome(options=options)
+            # Only mark the form as loaded once everything needed for submission is known
+            self.entry_ids = entry_ids
+            self.action_url = f"https://docs.google.com/forms/d/e/{form_id_match.group(1)}/formResponse"
+            logger.info(f"Discovered form fields: {', '.join(self.entry_ids[:3])}")
             return True
-        except WebDriverException as e:
-            logger.error(f"Failed to set up WebDriver: {e}")
+        except requests.RequestException as e:
+            logger.error(f"Failed to load form: {e}")
             return False
     
-    def submit_property(self, property_data: Dict[str, str]) -> bool:
+    @staticmethod
+    def _extract_entry_ids(html_content: str) -> List[str]:
         """
-        Submit a property's data to the Google Form.
+        Extract the `entry.<id>` field names in form order.
         
         Args:
-            property_data: Dictionary containing property information
+            html_content: The HTML content of the form page
             
         Returns:
-            True if submission was successful, False otherwise
+            List of field names such as "entry.123456"
         """
-        try:
-            if not self.driver:
-                logger.error("WebDriver not initialized")
-                return False
-                
-            logger.info(f"Submitting property: {property_data['address']}")
+        load_data_match = FB_LOAD_DATA_RE.search(html_content)
+        if load_data_match:
+            try:
+                questions = json.loads(load_data_match.group(1))[1][1]
+                return [f"entry.{question[4][0][0]}" for question in questions if question[4]]
+            except (ValueError, IndexError, TypeError) as e:
+                logger.warning(f"Could not parse form load data, falling back to input names: {e}")
+        
+        # Fall back to the rendered input names, preserving order
+        return list(dict.fromkeys(ENTRY_NAME_RE.findall(html_content)))
+    
+    def _build_payload(self, property_data: Property) -> Dict[str, str]:
+        """
+        Map a property's fields onto the form's entry IDs.
+        
+        Args:
+            property_data: The property to submit
             
-            # Navigate to the form
-            self.driver.get(self.form_url)
+        Returns:
+            Form-encoded payload for the formResponse endpoint
+        """
+        return {
+            self.entry_ids[0]: property_data.link,
+            self.entry_ids[1]: property_data.price,
+            self.entry_ids[2]: property_data.address,
+        }
+    
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential_jitter(initial=0.5, max=4),
+        retry=retry_if_exception(_is_retryable_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _post_payload(self, client: httpx.AsyncClient, payload: Dict[str, str]) -> None:
+        """
+        POST a payload to the form, retrying with jittered exponential backoff on failure.
+        
+        Args:
+            client: The shared HTTP/2 client
+            payload: Form-encoded payload for the formResponse endpoint
+        """
+        response = await client.post(self.action_url, data=payload)
+        response.raise_for_status()
+    
+    async def submit_property(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                              property_data: Property) -> bool:
+        """
+        Submit a property's data to the Google Form.
+        
+        Args:
+            client: The shared HTTP/2 client
+            semaphore: Semaphore bounding the number of in-flight submissions
+            property_data: The property to submit
             
-            # Wait for form to load
-            wait = WebDriverWait(self.driver, WAIT_TIME)
-            input_fields = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "input[type='text']")))
+        Returns:
+            True if submission was successful, False otherwise
+        """
+        if not self.action_url:
+            logger.error("Form not loaded")
+            return False
+        
+        payload = self._build_payload(property_data)
+        
+        async with semaphore:
+            logger.info(f"Submitting property: {property_data.address}")
             
-            if len(input_fields) < 3:
-                logger.error(f"Expected at least 3 input fields, found {len(input_fields)}")
+            try:
+                await self._post_payload(client, payload)
+            except httpx.HTTPError as e:
+                # Retryable errors only surface here once every attempt has been used
+                if _is_retryable_error(e):
+                    logger.error(f"Error submitting form after {MAX_RETRIES} attempts: {e}")
+                else:
+                    logger.error(f"Form rejected submission: {e}")
                 return False
+        
+        logger.info("Form submitted successfully")
+        return True
+    
+    async def _submit_all(self, properties: List[Property]) -> List[bool]:
+        """
+        Submit all properties concurrently as HTTP/2 streams over a single connection.
+        
+        Args:
+            properties: List of properties to submit
             
-            # Fill in the form fields
-            input_fields[0].send_keys(property_data["link"])
-            time.sleep(0.5)  # Small delay between inputs
-            
-            input_fields[1].send_keys(property_data["price"])
-            time.sleep(0.5)
-            
-            input_fields[2].send_keys(property_data["address"])
-            time.sleep(0.5)
-            
-            # Submit the form
-            submit_button = self.driver.find_element(By.XPATH, 
-                                                    '//*[@id="mG61Hd"]/div[2]/div/div[3]/div[1]/div[1]/div')
-            submit_button.click()
-            
-            # Wait for submission confirmation
-            time.sleep(1)
-            
-            # Check if we're back on the form confirmation page
-            current_url = self.driver.current_url
-            if "formResponse" in current_url:
-                logger.info("Form submitted successfully")
-                return True
-            else:
-                logger.warning("Form submission may have failed")
-                return False
-                
-        except TimeoutException:
-            logger.error("Timed out waiting for form elements to load")
-            return False
-        except NoSuchElementException as e:
-            logger.error(f"Element not found: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Error submitting form: {e}")
-            return False
+        Returns:
+            List of submission results in the same order as the properties
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMISSIONS)
+        # One connection multiplexes every submission, so queued requests wait on the pool indefinitely
+        timeout = httpx.Timeout(REQUEST_TIMEOUT, pool=None)
+        limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        
+        # Carry over the cookies set while loading the form so submissions share its session
+        cookies = self.session.cookies.get_dict()
+        
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout, cookies=cookies) as client:
+            return await asyncio.gather(
+                *(self.submit_property(client, semaphore, prop) for prop in properties)
+            )
     
-    def submit_all_properties(self, properties: List[Dict[str, str]]) -> Tuple[int, int]:
+    def submit_all_properties(self, properties: List[Property]) -> Tuple[int, int]:
         """
         Submit all properties to the Google Form.
         
         Args:
-            properties: List of property dictionaries
+            properties: List of properties to submit
             
         Returns:
             Tuple of (successful_submissions, total_submissions)
         """
-        if not self.setup_driver():
+        # Reuse the fields discovered on entry; only fetch the form page if that hasn't happened yet
+        if not self.action_url and not self.load_form():
             return 0, len(properties)
             
-        successful = 0
         total = len(properties)
+        logger.info(f"Submitting {total} properties with up to {MAX_CONCURRENT_SUBMISSIONS} concurrent requests")
         
-        for i, prop in enumerate(properties):
-            logger.info(f"Processing property {i+1}/{total}")
-            
-            # Add retry mechanism
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    if self.submit_property(prop):
-                        successful += 1
-                        break
-                    else:
-                        logger.warning(f"Submission failed, attempt {attempt+1}/{max_retries}")
-                        time.sleep(2)  # Wait before retry
-                except Exception as e:
-                    logger.error(f"Error during submission: {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2)  # Wait before retry
-            
-            # Add a delay between submissions to prevent rate limiting
-            time.sleep(2)
+        results = asyncio.run(self._submit_all(properties))
+        successful = sum(results)
         
         logger.info(f"Completed submissions: {successful}/{total} successful")
         return successful, total
     
     def close(self):
-        """Close the WebDriver if it's open."""
-        if self.driver:
-            logger.info("Closing WebDriver")
-            try:
-                self.driver.quit()
-            except Exception as e:
-                logger.error(f"Error closing WebDriver: {e}")
+        """Close the HTTP session."""
+        logger.info("Closing form session")
+        self.session.close()
     
     def __enter__(self):
         """Context manager entry."""
-        self.setup_driver()
+        self.load_form()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -334,39 +550,59 @@ class GoogleFormSubmitter:
         self.close()
 
 
-def download_responses(response_url: str) -> bool:
+def download_responses(sheet_name: str, output_file: str = RESPONSES_CSV_FILE,
+                       credentials_file: str = GOOGLE_CREDENTIALS_FILE) -> bool:
     """
-    Download the form responses as CSV.
+    Download the form responses as CSV by exporting the linked responses spreadsheet.
     
     Args:
-        response_url: URL to the form responses page
+        sheet_name: Name of the spreadsheet the form's responses are linked to
+        output_file: Path of the CSV file to write
+        credentials_file: Service account key file with read access to the spreadsheet
         
     Returns:
         True if download was successful, False otherwise
     """
+    # The Google API client is only needed here, so keep it off the scrape and submit paths
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import MediaIoBaseDownload
+    
     try:
-        logger.info(f"Downloading responses from {response_url}")
-        options = Options()
-        options.add_experimental_option("detach", False)
+        logger.info(f"Downloading responses from spreadsheet '{sheet_name}'")
+        credentials = service_account.Credentials.from_service_account_file(credentials_file, scopes=DRIVE_SCOPES)
+        drive = build("drive", "v3", credentials=credentials, cache_discovery=False)
         
-        with webdriver.Chrome(options=options) as driver:
-            driver.get(response_url)
-            
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Find and click the download button
-            download_button = driver.find_element(
-                By.XPATH, 
-                '/html/body/div[3]/div[2]/div[2]/div/div[1]/div[1]/div[2]/div[1]/div[1]/div'
-            )
-            download_button.click()
-            
-            # Wait for download to start
-            time.sleep(5)
-            
-            logger.info("Responses download initiated")
-            return True
+        # Look up the responses spreadsheet by name, preferring the most recently modified one
+        escaped_name = sheet_name.replace("\\", "\\\\").replace("'", "\\'")
+        result = drive.files().list(
+            q=f"name = '{escaped_name}' and mimeType = '{SPREADSHEET_MIME_TYPE}' and trashed = false",
+            fields="files(id, name, modifiedTime)",
+            orderBy="modifiedTime desc",
+            pageSize=2,
+        ).execute()
+        files = result.get("files", [])
+        if not files:
+            logger.error(f"No spreadsheet named '{sheet_name}' is shared with the service account")
+            return False
+        if len(files) > 1:
+            logger.warning(f"Multiple spreadsheets named '{sheet_name}' found, "
+                           f"exporting the most recently modified one ({files[0]['id']})")
+        
+        # Stream the CSV export straight to disk
+        request = drive.files().export_media(fileId=files[0]["id"], mimeType="text/csv")
+        with open(output_file, "wb") as csv_file:
+            downloader = MediaIoBaseDownload(csv_file, request)
+            done = False
+            while not done:
+                _, done = downloader.next_chunk()
+        
+        logger.info(f"Responses downloaded to {output_file}")
+        return True
+    except HttpError as e:
+        logger.error(f"Google API request failed: {e}")
+        return False
     except Exception as e:
         logger.error(f"Failed to download responses: {e}")
         return False
@@ -378,8 +614,8 @@ def main():
         logger.info("Starting Zillow Real Estate Data Scraper")
         
         # Scrape properties
-        scraper = PropertyScraper(ZILLOW_CLONE_URL)
-        success, count = scraper.scrape()
+        with PropertyScraper(ZILLOW_CLONE_URL) as scraper:
+            success, count = scraper.scrape()
         
         if not success or count == 0:
             logger.error("Scraping failed or no properties found")
@@ -398,11 +634,14 @@ def main():
             
         logger.info(f"Completed: {successful}/{total} submissions successful")
         
-        # Option to download responses
+        # Option to download responses; the linked sheet is named after the form title
         if successful > 0:
-            download = input("Do you want to download form responses? (y/n): ").lower()
-            if download == 'y':
-                download_responses(RESPONSES_URL)
+            if not submitter.form_title:
+                logger.error("Form title could not be determined, skipping responses download")
+            else:
+                download = input("Do you want to download form responses? (y/n): ").lower()
+                if download == 'y':
+                    download_responses(f"{submitter.form_title}{RESPONSES_SHEET_SUFFIX}")
         
         logger.info("Script execution completed")
     except Exception as e: